@@ -1,5 +1,7 @@
 import fnmatch
 import itertools
+import os
+import re
 from collections import deque
 from collections.abc import Iterable
 from collections.abc import Iterator
@@ -36,6 +38,9 @@ exclude_patterns = [
     ".pre-commit-config.yaml",
 ]
 
+# All exclude globs folded into one regex so each path is matched in a single pass.
+_exclude_re = re.compile("|".join(fnmatch.translate(os.path.normcase(p)) for p in exclude_patterns))
+
 
 def _batch_gitlab_objects(git_objs: Iterable[T], batch_size: int) -> Iterator[list[T]]:
     it = iter(git_objs)
@@ -155,7 +160,7 @@ def _convert_code_to_document(
 
 def _should_exclude(path: str) -> bool:
     """Check if a path matches any of the exclude patterns."""
-    return any(fnmatch.fnmatch(path, pattern) for pattern in exclude_patterns)
+    return _exclude_re.match(os.path.normcase(path)) is not None
 
 
 class GitlabConnector(LoadConnector, PollConnector):